@@ -98,6 +98,8 @@ class ArmoryMainWindow(QMainWindow):
       # Load the settings file
       self.settingsPath = CLI_OPTIONS.settingsPath
       self.settings = SettingsFile(self.settingsPath)
+      self.wltSettingsCache = {}
+      self.wltTypeCache = {}
 
       # SETUP THE WINDOWS DECORATIONS
       self.lblLogoIcon = QLabel()
@@ -156,6 +158,7 @@ class ArmoryMainWindow(QMainWindow):
       self.entropyAccum = []
       self.allLockboxes = []
       self.lockboxIDMap = {}
+      self.lockboxP2SHMap = {}
       self.cppLockboxWltMap = {}
 
       # Full list of notifications, and notify IDs that should trigger popups
@@ -197,8 +200,10 @@ class ArmoryMainWindow(QMainWindow):
       #generic signal to run pass any method as the arg
       self.connect(self, SIGNAL('method_signal') , self.method_signal)  
                 
-      #push model BDM notify signal
-      self.connect(self, SIGNAL('cppNotify'), self.handleCppNotification)
+      #push model BDM notify signal, always queued so the BDM thread never
+      #runs GUI code and never waits on the slot
+      self.connect(self, SIGNAL('cppNotify'), self.handleCppNotification, \
+                   Qt.QueuedConnection)
       TheBDM.registerCppNotification(self.cppNotifySignal)
 
       # We want to determine whether the user just upgraded to a new version
@@ -282,6 +287,7 @@ class ArmoryMainWindow(QMainWindow):
 
       # Table for all the wallets
       self.walletModel = AllWalletsDispModel(self)
+      self.walletModelStale = False
       self.walletsView  = QTableView(self)
 
       w,h = tightSizeNChar(self.walletsView, 55)
@@ -907,36 +913,38 @@ class ArmoryMainWindow(QMainWindow):
          for i in range(0, len(self.walletVisibleList)):         
             self.walletVisibleList[i] = False
             
-      # If a specific wallet is selected, just set that and you're done
-      if currIdx > 4:
-         self.walletVisibleList[currIdx-7] = True
-         self.setWltSetting(self.walletIDList[currIdx-7], 'LedgerShow', True)
-      else:
-         # Else we walk through the wallets and flag the particular ones
-         typelist = [[wid, determineWalletType(self.walletMap[wid], self)[0]] \
-                                                   for wid in self.walletIDList]
-
-         for i,winfo in enumerate(typelist):
-            wid,wtype = winfo[:]
-            if currIdx==0:
-               # My wallets
-               doShow = wtype in [WLTTYPES.Offline,WLTTYPES.Crypt,WLTTYPES.Plain]
-               self.walletVisibleList[i] = doShow
-               self.setWltSetting(wid, 'LedgerShow', doShow)
-            elif currIdx==1:
-               # Offline wallets
-               doShow = winfo[1] in [WLTTYPES.Offline]
-               self.walletVisibleList[i] = doShow
-               self.setWltSetting(wid, 'LedgerShow', doShow)
-            elif currIdx==2:
-               # Others' Wallets
-               doShow = winfo[1] in [WLTTYPES.WatchOnly]
-               self.walletVisibleList[i] = doShow
-               self.setWltSetting(wid, 'LedgerShow', doShow)
-            elif currIdx==3:
-               # All Wallets
-               self.walletVisibleList[i] = True
-               self.setWltSetting(wid, 'LedgerShow', True)
+      # One settings-file write for the whole loop, not one per wallet
+      with self.settings.batchUpdate():
+         # If a specific wallet is selected, just set that and you're done
+         if currIdx > 4:
+            self.walletVisibleList[currIdx-7] = True
+            self.setWltSetting(self.walletIDList[currIdx-7], 'LedgerShow', True)
+         else:
+            # Else we walk through the wallets and flag the particular ones
+            typelist = [[wid, determineWalletType(self.walletMap[wid], self)[0]] \
+                                                      for wid in self.walletIDList]
+
+            for i,winfo in enumerate(typelist):
+               wid,wtype = winfo[:]
+               if currIdx==0:
+                  # My wallets
+                  doShow = wtype in [WLTTYPES.Offline,WLTTYPES.Crypt,WLTTYPES.Plain]
+                  self.walletVisibleList[i] = doShow
+                  self.setWltSetting(wid, 'LedgerShow', doShow)
+               elif currIdx==1:
+                  # Offline wallets
+                  doShow = winfo[1] in [WLTTYPES.Offline]
+                  self.walletVisibleList[i] = doShow
+                  self.setWltSetting(wid, 'LedgerShow', doShow)
+               elif currIdx==2:
+                  # Others' Wallets
+                  doShow = winfo[1] in [WLTTYPES.WatchOnly]
+                  self.walletVisibleList[i] = doShow
+                  self.setWltSetting(wid, 'LedgerShow', doShow)
+               elif currIdx==3:
+                  # All Wallets
+                  self.walletVisibleList[i] = True
+                  self.setWltSetting(wid, 'LedgerShow', True)
       
       self.mainLedgerCurrentPage = 1
       self.PageLineEdit.setText(str(self.mainLedgerCurrentPage))
@@ -2945,10 +2953,19 @@ class ArmoryMainWindow(QMainWindow):
    ##############################################################################
    def getWltSetting(self, wltID, propName, defaultValue=''):
       # Sometimes we need to settings specific to individual wallets -- we will
-      # prefix the settings name with the wltID.
+      # prefix the settings name with the wltID.  These get hit for every
+      # wallet on every table repaint (i.e. determineWalletType), so we keep
+      # the values in a dict keyed by (wltID, propName) and only go to the
+      # settings file on a miss.
+      cacheKey = (wltID, propName)
+      if cacheKey in self.wltSettingsCache:
+         return self.wltSettingsCache[cacheKey]
+
       wltPropName = 'Wallet_%s_%s' % (wltID, propName)
       if self.settings.hasSetting(wltPropName):
-         return self.settings.get(wltPropName)
+         val = self.settings.get(wltPropName)
+         self.wltSettingsCache[cacheKey] = val
+         return val
       else:
          if not defaultValue=='':
             self.setWltSetting(wltID, propName, defaultValue)
@@ -2956,8 +2973,25 @@ class ArmoryMainWindow(QMainWindow):
 
    #############################################################################
    def setWltSetting(self, wltID, propName, value):
+      # Write-through:  the settings file is still the persistent copy
       wltPropName = 'Wallet_%s_%s' % (wltID, propName)
       self.writeSetting(wltPropName, value)
+      self.wltSettingsCache[(wltID, propName)] = self.settings.get(wltPropName)
+
+   #############################################################################
+   def getWltType(self, wlt):
+      # determineWalletType is called for every cell on every repaint of the
+      # wallet, ledger and tx tables (for the background color), and each call
+      # does a tr() lookup.  Keep the result per wallet, and recompute it only
+      # when one of its inputs changes, so no explicit invalidation is needed.
+      wltID = wlt.uniqueIDB58
+      isMine = wlt.watchingOnly and self.getWltSetting(wltID, 'IsMine')
+      stateKey = (wlt.watchingOnly, wlt.useEncryption, isMine)
+      cached = self.wltTypeCache.get(wltID)
+      if cached is None or not cached[0]==stateKey:
+         cached = (stateKey, determineWalletType(wlt, self))
+         self.wltTypeCache[wltID] = cached
+      return cached[1]
 
 
    #############################################################################
@@ -2972,6 +3006,8 @@ class ArmoryMainWindow(QMainWindow):
    #############################################################################
    def loadLockboxesFromFile(self, fn):
       self.allLockboxes = []
+      self.lockboxIDMap.clear()
+      self.lockboxP2SHMap.clear()
       self.cppLockboxWltMap = {}
       if not os.path.exists(fn):
          return
@@ -2991,6 +3027,7 @@ class ArmoryMainWindow(QMainWindow):
             # Add new lockbox to list
             self.allLockboxes.append(lbObj)
             self.lockboxIDMap[lbID] = len(self.allLockboxes)-1
+            self.lockboxP2SHMap[binScript_to_p2shAddrStr(lbObj.binScript)] = lbID
               
             scraddrReg = script_to_scrAddr(lbObj.binScript)
             scraddrP2SH = script_to_scrAddr(script_to_p2sh_script(lbObj.binScript))
@@ -3023,8 +3060,11 @@ class ArmoryMainWindow(QMainWindow):
    #############################################################################
    def reconstructLockboxMaps(self):
       self.lockboxIDMap.clear()
+      self.lockboxP2SHMap.clear()
       for i,box in enumerate(self.allLockboxes):
          self.lockboxIDMap[box.uniqueIDB58] = i
+         self.lockboxP2SHMap[binScript_to_p2shAddrStr(box.binScript)] = \
+                                                            box.uniqueIDB58
 
    #############################################################################
    def getLockboxByID(self, boxID):
@@ -3035,11 +3075,9 @@ class ArmoryMainWindow(QMainWindow):
    # Get  the lock box ID if the p2shAddrString is found in one of the lockboxes
    # otherwise it returns None
    def getLockboxByP2SHAddrStr(self, p2shAddrStr):
-      for lboxId in self.lockboxIDMap.keys():
-         lbox = self.allLockboxes[self.lockboxIDMap[lboxId]]
-         if p2shAddrStr == binScript_to_p2shAddrStr(lbox.binScript):
-            return lbox
-      return None
+      # lockboxP2SHMap is kept alongside lockboxIDMap, so this is a lookup
+      # rather than hashing and encoding every lockbox script on each call
+      return self.getLockboxByID(self.lockboxP2SHMap.get(p2shAddrStr))
 
 
    #############################################################################
@@ -3282,6 +3320,13 @@ class ArmoryMainWindow(QMainWindow):
    def convertLedgerToTable(self, ledger, showSentToSelfAmt=True, wltIDIn=None):
       table2D = []
       datefmt = self.getPreferredDateFormat()
+      topBlock = TheBDM.getTopBlockHeight()
+      walletMap = self.walletMap
+
+      # The watch-only flag and display name only depend on the wltID, and a
+      # page of ledger entries usually spans just a few wallets/lockboxes, so
+      # work them out once per ID (None for an unknown lockbox)
+      wltInfoMap = {}
       for le in ledger:
          if wltIDIn is None:
             wltID = le.getWalletID()
@@ -3290,23 +3335,30 @@ class ArmoryMainWindow(QMainWindow):
           
          row = []
 
-         wlt = self.walletMap.get(wltID)
+         wlt = walletMap.get(wltID)
+
+         if not wltID in wltInfoMap:
+            if wlt:
+               isWatch = (self.getWltType(wlt)[0] == WLTTYPES.WatchOnly)
+               wltInfoMap[wltID] = (isWatch, wlt.labelName)
+            else:
+               lbox = self.getLockboxByID(wltID)
+               wltInfoMap[wltID] = None if not lbox else (True, \
+                  '%s-of-%s: %s (%s)' % (lbox.M, lbox.N, lbox.shortName, wltID))
+
+         wltInfo = wltInfoMap[wltID]
+         if wltInfo is None:
+            continue
+         isWatch, wltName = wltInfo
 
          if wlt:
-            isWatch = (determineWalletType(wlt, self)[0] == WLTTYPES.WatchOnly)
-            wltName = wlt.labelName 
             dispComment = self.getCommentForLE(le, wltID)
          else:
-            lboxId = wltID
-            lbox = self.getLockboxByID(lboxId)
-            if not lbox:
-               continue
-            isWatch = True
-            wltName = '%s-of-%s: %s (%s)' % (lbox.M, lbox.N, lbox.shortName, lboxId)
-            dispComment = self.getCommentForLockboxTx(lboxId, le)
+            dispComment = self.getCommentForLockboxTx(wltID, le)
 
-         nConf = TheBDM.getTopBlockHeight() - le.getBlockNum()+1
-         if le.getBlockNum()>=0xffffffff:
+         blkNum = le.getBlockNum()
+         nConf = topBlock - blkNum+1
+         if blkNum>=0xffffffff:
             nConf=0
 
          # If this was sent-to-self... we should display the actual specified
@@ -3315,21 +3367,25 @@ class ArmoryMainWindow(QMainWindow):
          # They're actually not because we ALWAYS generate a new address to
          # for change , which means the change address MUST have a higher
          # chain index
-         amt = le.getValue()
-         if le.isSentToSelf() and wlt and showSentToSelfAmt:
+         leValue = le.getValue()
+         sentToSelf = le.isSentToSelf()
+         txTime = le.getTxTime()
+
+         amt = leValue
+         if sentToSelf and wlt and showSentToSelfAmt:
             amt = determineSentToSelfAmt(le, wlt)[0]
 
          # NumConf
          row.append(nConf)
 
          # UnixTime (needed for sorting)
-         row.append(le.getTxTime())
+         row.append(txTime)
 
          # Date
-         row.append(unixTimeToFormatStr(le.getTxTime(), datefmt))
+         row.append(unixTimeToFormatStr(txTime, datefmt))
 
          # TxDir (actually just the amt... use the sign of the amt to determine dir)
-         row.append(coin2str(le.getValue(), maxZeros=2))
+         row.append(coin2str(leValue, maxZeros=2))
 
          # Wlt Name
          row.append(wltName)
@@ -3353,7 +3409,7 @@ class ArmoryMainWindow(QMainWindow):
          row.append( le.isCoinbase() )
 
          # Sent-to-self
-         row.append( le.isSentToSelf() )
+         row.append( sentToSelf )
 
          # Finally, attach the row to the table
          table2D.append(row)
@@ -3527,6 +3583,7 @@ class ArmoryMainWindow(QMainWindow):
 
       del self.walletMap[wltID]
       del self.walletIndices[wltID]
+      self.wltTypeCache.pop(wltID, None)
       self.walletIDSet.remove(wltID)
       del self.walletIDList[idx]
       del self.walletVisibleList[idx]
@@ -4146,6 +4203,30 @@ class ArmoryMainWindow(QMainWindow):
       self.activateWindow()
       self.raise_()
 
+   #############################################################################
+   def refreshWalletModel(self, wltIDList=None):
+      """
+      Refresh the wallet table (or only the rows for wltIDList).  Balance and
+      scan-progress updates keep arriving while Armory sits minimized in the
+      system tray, so when the window is hidden we just flag the table as
+      stale and do a single reset in showEvent.
+      """
+      if not self.isVisible():
+         self.walletModelStale = True
+         return
+
+      if wltIDList is None:
+         self.walletModel.reset()
+      else:
+         self.walletModel.refreshWallets(wltIDList)
+
+   #############################################################################
+   def showEvent(self, event):
+      super(ArmoryMainWindow, self).showEvent(event)
+      if self.walletModelStale:
+         self.walletModelStale = False
+         self.walletModel.reset()
+
    #############################################################################
    def minimizeArmory(self):
       LOGDEBUG('Minimizing Armory')
@@ -6202,7 +6283,7 @@ class ArmoryMainWindow(QMainWindow):
             self.notifyQueue.append([le.getWalletID(), le, False])
                
       self.createCombinedLedger()
-      self.walletModel.reset()
+      self.refreshWalletModel()
       self.lockboxLedgModel.reset()
 
    #############################################################################
@@ -6249,7 +6330,7 @@ class ArmoryMainWindow(QMainWindow):
                   { 'color' : htmlColor('TextGreen'), 'hgt' : TheBDM.getTopBlockHeight()})
 
             # Update the wallet view to immediately reflect new balances
-            self.walletModel.reset()    
+            self.refreshWalletModel()
       elif action == REFRESH_ACTION:
          #The wallet ledgers have been updated from an event outside of new ZC
          #or new blocks (usually a wallet or address was imported, or the 
@@ -6264,7 +6345,7 @@ class ArmoryMainWindow(QMainWindow):
                if wltID in self.walletMap:
                   wlt = self.walletMap[wltID]                  
                   wlt.isEnabled = True
-                  self.walletModel.reset()                  
+                  self.refreshWalletModel([wltID])
                   wlt.doAfterScan()                  
                   self.changeWltFilter()              
 
@@ -6273,7 +6354,7 @@ class ArmoryMainWindow(QMainWindow):
                   self.allLockboxes[lbID].isEnabled = True
                   
                   if self.lbDialogModel != None:
-                     self.lbDialogModel.reset()
+                     self.lbDialogModel.refreshLockboxes([wltID])
                  
                   if self.lbDialog != None:
                      self.lbDialog.changeLBFilter()               
@@ -6291,24 +6372,24 @@ class ArmoryMainWindow(QMainWindow):
          wltIDList = args[0]
          prog = args[1]
          
-         hasWallet = False
-         hasLockbox = False
+         scanWltIDs = []
+         scanLbIDs = []
          for wltID in wltIDList:
             self.walletSideScanProgress[wltID] = prog*100
             
             if wltID in self.walletMap:
-               hasWallet = True
+               scanWltIDs.append(wltID)
             else:
-               hasLockbox = True
+               scanLbIDs.append(wltID)
 
                 
-         if hasWallet:
-            self.walletModel.reset()   
+         if scanWltIDs:
+            self.refreshWalletModel(scanWltIDs)
          
-         if hasLockbox:
+         if scanLbIDs:
             self.lockboxLedgModel.reset()
             if self.lbDialogModel != None:
-               self.lbDialogModel.reset()                     
+               self.lbDialogModel.refreshLockboxes(scanLbIDs)
                
       elif action == WARNING_ACTION:
          #something went wrong on the C++ side, create a message box to report
@@ -6337,7 +6418,7 @@ class ArmoryMainWindow(QMainWindow):
          wltIDList = args[0]
          
          hasWallet = False
-         hasLockbox = False
+         scanLbIDs = []
          
          for wltID in wltIDList:
             self.walletSideScanProgress[wltID] = 0    
@@ -6354,14 +6435,14 @@ class ArmoryMainWindow(QMainWindow):
                else:
                   lbID = self.lockboxIDMap[wltID]                
                   self.allLockboxes[lbID].isEnabled = False
-                  hasLockbox = True
+                  scanLbIDs.append(wltID)
          
          if hasWallet:
             self.changeWltFilter()  
             
-         if hasLockbox:
+         if scanLbIDs:
             if self.lbDialogModel != None:
-               self.lbDialogModel.reset()       
+               self.lbDialogModel.refreshLockboxes(scanLbIDs)
                     
             if self.lbDialog != None:
                self.lbDialog.resetLBSelection()   
@@ -2823,6 +2823,12 @@ class Armory_Json_Rpc_Server(jsonrpc.JSONRPC):
 jFunctPrefix = "jsonrpc_"
 jFuncts = inspect.getmembers(Armory_Json_Rpc_Server, predicate=inspect.ismethod)
 
+# The same patterns are applied to every docstring, so compile them once.
+jDocSectionRegex = re.compile( \
+         '[ \n]*DESCRIPTION:[ \n]*|[ \n]*PARAMETERS:[ \n]*|[ \n]*RETURN:[ \n]*')
+jDocParamRegex = re.compile(r'([^\s]+) - ')
+jDocNewlineRegex = re.compile(r' *\n *')
+
 # Check only the applicable functs.
 for curJFunct in jFuncts:
    if curJFunct[0].startswith(jFunctPrefix):
@@ -2833,8 +2839,7 @@ for curJFunct in jFuncts:
       # Save the descrip/param/return data while stripping out the targeted
       # strings (e.g., "PARAMETERS:"). Also, filter out the empty string in
       # the resultant list, which should have three entries in the end.
-      m = '[ \n]*DESCRIPTION:[ \n]*|[ \n]*PARAMETERS:[ \n]*|[ \n]*RETURN:[ \n]*'
-      functSplit = filter(None, re.split(m, str(curJFunct[1].__doc__)))
+      functSplit = filter(None, jDocSectionRegex.split(str(curJFunct[1].__doc__)))
 
       if(len(functSplit) != 3):
          functDoc['Error'] = 'The function description is malformed.'
@@ -2847,9 +2852,9 @@ for curJFunct in jFuncts:
          # Return Value: Replace newlines & extra space w/ 1 space, then strip
          #               leading & trailing whitespace. (This allows vals to be
          #               described over multiple lines.)
-         functSplit[0] = re.sub(r' *\n *', ' ', functSplit[0]).strip()
+         functSplit[0] = jDocNewlineRegex.sub(' ', functSplit[0]).strip()
          functSplit[1] = functSplit[1].strip()
-         functSplit[2] = re.sub(r' *\n *', ' ', functSplit[2]).strip()
+         functSplit[2] = jDocNewlineRegex.sub(' ', functSplit[2]).strip()
 
          # Create the return dict and param list, then populate the param list.
          # If the parameter entry is "None", just save it. If there are params,
@@ -2870,11 +2875,10 @@ for curJFunct in jFuncts:
          if functSplit[1] == 'None':
             functParams.append(functSplit[1])
          else:
-            functSplit2 = filter(None, (re.split(r'([^\s]+) - ', \
-                                                 functSplit[1])))
+            functSplit2 = filter(None, jDocParamRegex.split(functSplit[1]))
             functSplit3 = getDualIterable(functSplit2)
             for pName, pDescrip in functSplit3:
-               pDescripClean = re.sub(r' *\n *', ' ', pDescrip).strip()
+               pDescripClean = jDocNewlineRegex.sub(' ', pDescrip).strip()
                pStr = '%s - %s' % (pName, pDescripClean)
                functParams.append(pStr)
 
@@ -13,6 +13,7 @@
 #
 ################################################################################
 import ast
+from contextlib import contextmanager
 from datetime import datetime
 from email.MIMEMultipart import MIMEMultipart
 from email.MIMEBase import MIMEBase
@@ -29,6 +30,7 @@ import optparse
 import os
 import platform
 import random
+import re
 import signal
 import smtplib
 from struct import pack, unpack
@@ -36,6 +38,7 @@ from itertools import izip
 #from subprocess import PIPE
 import sys
 import threading
+import Queue
 import time
 import traceback
 import shutil
@@ -135,7 +138,11 @@ parser.add_option("--coverage_include", dest="coverageInclude", default=None, ty
 
 # Some useful constants to be used throughout everything
 BASE58CHARS  = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+BASE58VALUES = dict([(c,i) for i,c in enumerate(BASE58CHARS)])
+BASE58PAIRS  = [a+b for a in BASE58CHARS for b in BASE58CHARS]
 BASE16CHARS  = '0123456789abcdefABCDEF'
+NONBASE58REGEX = re.compile('[^%s]' % BASE58CHARS)
+NONBASE16REGEX = re.compile('[^%s]' % BASE16CHARS)
 LITTLEENDIAN  = '<'
 BIGENDIAN     = '>'
 NETWORKENDIAN = '!'
@@ -1562,7 +1569,11 @@ def script_to_addrStr(binScript):
    return scrAddr_to_addrStr(script_to_scrAddr(binScript))
 
 ################################################################################
-def scrAddr_to_addrStr(scrAddr):
+def _checkScrAddr(scrAddr):
+   """
+   Shared by scrAddr_to_addrStr and scrAddr_to_hash160 so they raise the same
+   errors.  Returns the prefix byte, which is P2PKH or P2SH if this returns.
+   """
    if len(scrAddr)==0:
       raise BadAddressError('Empty scrAddr')
 
@@ -1570,28 +1581,33 @@ def scrAddr_to_addrStr(scrAddr):
    if not prefix in SCRADDR_BYTE_LIST or not len(scrAddr)==21:
       raise BadAddressError('Invalid ScrAddress')
 
-   if prefix==SCRADDR_P2PKH_BYTE:
-      return hash160_to_addrStr(scrAddr[1:])
-   elif prefix==SCRADDR_P2SH_BYTE:
-      return hash160_to_p2shAddrStr(scrAddr[1:])
-   else:
+   if not prefix in (SCRADDR_P2PKH_BYTE, SCRADDR_P2SH_BYTE):
       LOGERROR('Unsupported scrAddr type: "%s"' % binary_to_hex(scrAddr))
       raise BadAddressError('Can only convert P2PKH and P2SH scripts')
 
+   return prefix
+
+################################################################################
+def scrAddr_to_addrStr(scrAddr):
+   if _checkScrAddr(scrAddr)==SCRADDR_P2PKH_BYTE:
+      return hash160_to_addrStr(scrAddr[1:])
+   else:
+      return hash160_to_p2shAddrStr(scrAddr[1:])
+
 ################################################################################
-# We beat around the bush here, to make sure it goes through addrStr which
-# triggers errors if this isn't a regular addr or P2SH addr
+# Raises the same errors as going through scrAddr_to_addrStr if this isn't a
+# regular addr or P2SH addr, but without encoding to Base58 and decoding again
 def scrAddr_to_hash160(scrAddr):
-   addr = scrAddr_to_addrStr(scrAddr)
-   atype, a160 = addrStr_to_hash160(addr)
-   return (atype, a160)
+   if _checkScrAddr(scrAddr)==SCRADDR_P2PKH_BYTE:
+      return (ADDRBYTE, scrAddr[1:])
+   else:
+      return (P2SHBYTE, scrAddr[1:])
 
 
 ################################################################################
 def addrStr_to_scrAddr(addrStr):
-   if not checkAddrStrValid(addrStr):
-      BadAddressError('Invalid address: "%s"' % addrStr)
-
+   # addrStr_to_hash160 raises on a bad length, checksum or prefix, so there
+   # is no need to decode the string a second time with checkAddrStrValid
    atype, a160 = addrStr_to_hash160(addrStr)
    if atype==ADDRBYTE:
       return SCRADDR_P2PKH_BYTE + a160
@@ -1715,6 +1731,7 @@ def enum(*sequential, **named):
 
 DATATYPE = enum("Binary", 'Base58', 'Hex')
 INTERNET_STATUS = enum('Available', 'Unavailable', 'DidNotCheck')
+INTERNET_CHECK_URLS = ['http://google.com', 'http://microsoft.com']
 
 
 def isLikelyDataType(theStr, dtype=None):
@@ -1723,10 +1740,8 @@ def isLikelyDataType(theStr, dtype=None):
    why it's called "likely" datatype...
    """
    ret = None
-   hexCount = sum([1 if c in BASE16CHARS else 0 for c in theStr])
-   b58Count = sum([1 if c in BASE58CHARS else 0 for c in theStr])
-   canBeHex = hexCount==len(theStr)
-   canBeB58 = b58Count==len(theStr)
+   canBeHex = NONBASE16REGEX.search(theStr) is None
+   canBeB58 = NONBASE58REGEX.search(theStr) is None
    if canBeHex:
       ret = DATATYPE.Hex
    elif canBeB58 and not canBeHex:
@@ -1802,12 +1817,14 @@ def RightNowStr(fmt=DEFAULT_DATE_FORMAT):
 # use hash256 and hash160 which use the first three to create the ONLY hash
 # operations we ever do in the bitcoin network
 # UPDATE:  mini-private-key format requires vanilla sha256...
+# The named constructors go straight to the OpenSSL-backed implementations,
+# skipping the by-name lookup that hashlib.new() does on every call.
 def sha1(bits):
-   return hashlib.new('sha1', bits).digest()
+   return hashlib.sha1(bits).digest()
 def sha256(bits):
-   return hashlib.new('sha256', bits).digest()
+   return hashlib.sha256(bits).digest()
 def sha512(bits):
-   return hashlib.new('sha512', bits).digest()
+   return hashlib.sha512(bits).digest()
 def ripemd160(bits):
    # It turns out that not all python has ripemd160...?
    #return hashlib.new('ripemd160', bits).digest()
@@ -1932,10 +1949,10 @@ def hex_to_binary(h, endIn=LITTLEENDIAN, endOut=LITTLEENDIAN):
    Converts hexadecimal to binary (in a python string).  Endianness is
    only switched if (endIn != endOut)
    """
-   bout = h.replace(' ','')  # copies data, no references
+   bout = h.replace(' ','').decode('hex_codec')
    if not endIn==endOut:
-      bout = hex_switchEndian(bout)
-   return bout.decode('hex_codec')
+      bout = bout[::-1]
+   return bout
 
 
 def binary_to_hex(b, endOut=LITTLEENDIAN, endIn=LITTLEENDIAN):
@@ -1943,10 +1960,10 @@ def binary_to_hex(b, endOut=LITTLEENDIAN, endIn=LITTLEENDIAN):
    Converts binary to hexadecimal.  Endianness is only switched
    if (endIn != endOut)
    """
-   hout = b.encode('hex_codec')
+   # Reverse the bytes before encoding so the whole conversion stays in C
    if not endOut==endIn:
-      hout = hex_switchEndian(hout)
-   return hout
+      b = b[::-1]
+   return b.encode('hex_codec')
 
 ##### Shorthand combo of prettyHex and binary_to_hex intended for use in debugging
 def ph(binaryInput):
@@ -2004,23 +2021,20 @@ def binary_to_base58(binstr):
    special kind of Base58 converter, which makes it usable for encoding other
    data, such as ECDSA keys or scripts.
    """
-   padding = 0;
-   for b in binstr:
-      if b=='\x00':
-         padding+=1
-      else:
-         break
+   padding = len(binstr) - len(binstr.lstrip('\x00'))
 
-   n = 0
-   for ch in binstr:
-      n *= 256
-      n += ord(ch)
+   # Let the hex codec and long() do the byte-by-byte accumulation in C,
+   # instead of a python loop with a multiply-add per byte
+   n = int(binstr.encode('hex_codec'), 16) if binstr else 0
 
-   b58 = ''
+   # Peel off two digits per divmod using the 58*58 pair table, and build
+   # them in a list: prepending to a str copies it every time.  The top pair
+   # may start with a zero digit, which the lstrip removes.
+   b58 = []
    while n > 0:
-      n, r = divmod (n, 58)
-      b58 = BASE58CHARS[r] + b58
-   return '1'*padding + b58
+      n, r = divmod(n, 3364)
+      b58.append(BASE58PAIRS[r])
+   return '1'*padding + ''.join(reversed(b58)).lstrip('1')
 
 
 ################################################################################
@@ -2035,27 +2049,23 @@ def base58_to_binary(addr):
    data, such as ECDSA keys or scripts.
    """
    # Count the zeros ('1' characters) at the beginning
-   padding = 0;
-   for c in addr:
-      if c=='1':
-         padding+=1
-      else:
-         break
+   padding = len(addr) - len(addr.lstrip('1'))
 
+   # Dict lookup instead of a linear BASE58CHARS.index() scan per character
    n = 0
    for ch in addr:
-      n *= 58
-      if ch in BASE58CHARS:
-         n += BASE58CHARS.index(ch)
-      else:
+      try:
+         n = n*58 + BASE58VALUES[ch]
+      except KeyError:
          raise NonBase58CharacterError("Unrecognized Base 58 Character: %s" % ch)
 
-   binOut = ''
-   while n>0:
-      d,m = divmod(n,256)
-      binOut = chr(m) + binOut
-      n = d
-   return '\x00'*padding + binOut
+   # Let the hex codec split the number into bytes in one shot
+   if n == 0:
+      return '\x00'*padding
+   hexOut = '%x' % n
+   if len(hexOut) % 2:
+      hexOut = '0' + hexOut
+   return '\x00'*padding + hexOut.decode('hex_codec')
 
 
 ################################################################################
@@ -2116,7 +2126,7 @@ def addrStr_is_p2sh(b58Str):
    if len(b58Str)==0:
       return False
 
-   if sum([(0 if c in BASE58CHARS else 1) for c in b58Str]) > 0:
+   if NONBASE58REGEX.search(b58Str):
       return False
 
    binStr = base58_to_binary(b58Str)
@@ -3503,6 +3513,24 @@ def HardcodedKeyMaskParams():
    return paramMap
 
 ################################################################################
+def replaceFile(srcPath, dstPath):
+   """
+   Rename srcPath to dstPath, replacing dstPath if it exists.  On POSIX the
+   rename is atomic.  os.rename won't overwrite on Windows, and removing the
+   target first would leave a window with no file at all, so use MoveFileEx.
+   """
+   if not OS_WINDOWS:
+      os.rename(srcPath, dstPath)
+      return
+
+   import ctypes
+   MOVEFILE_REPLACE_EXISTING = 0x1
+   if not ctypes.windll.kernel32.MoveFileExW(toUnicode(srcPath),
+                                             toUnicode(dstPath),
+                                             MOVEFILE_REPLACE_EXISTING):
+      raise ctypes.WinError()
+
+
 ################################################################################
 class SettingsFile(object):
    """
@@ -3525,6 +3553,8 @@ class SettingsFile(object):
    def __init__(self, path=None):
       self.settingsPath = path
       self.settingsMap = {}
+      self.batchDepth = 0
+      self.batchDirty = False
       if not path:
          self.settingsPath = os.path.join(ARMORY_HOME_DIR, 'ArmorySettings.txt')
 
@@ -3549,9 +3579,15 @@ class SettingsFile(object):
    #############################################################################
    def set(self, name, value):
       if isinstance(value, tuple):
-         self.settingsMap[name] = list(value)
-      else:
-         self.settingsMap[name] = value
+         value = list(value)
+
+      # Don't rewrite the whole file to store a value it already has
+      if self.settingsMap.has_key(name):
+         oldValue = self.settingsMap[name]
+         if type(oldValue)==type(value) and oldValue==value:
+            return
+
+      self.settingsMap[name] = value
       self.writeSettingsFile()
 
    #############################################################################
@@ -3573,10 +3609,12 @@ class SettingsFile(object):
 
    #############################################################################
    def get(self, name, expectList=False):
-      if not self.hasSetting(name) or self.settingsMap[name]=='':
+      # One dict lookup instead of hasSetting() plus two subscripts:  this is
+      # hit for every wallet setting miss and for some per-cell table roles
+      val = self.settingsMap.get(name, '')
+      if val=='':
          return ([] if expectList else '')
       else:
-         val = self.settingsMap[name]
          if expectList:
             if isinstance(val, list):
                return val
@@ -3607,31 +3645,64 @@ class SettingsFile(object):
          del self.settingsMap[name]
       self.writeSettingsFile()
 
+   #############################################################################
+   @contextmanager
+   def batchUpdate(self):
+      """
+      Every set()/delete() rewrites the whole file.  Wrap a run of updates
+      in "with settings.batchUpdate():" to write the file once at the end.
+      """
+      self.batchDepth += 1
+      try:
+         yield self
+      finally:
+         self.batchDepth -= 1
+         if self.batchDepth==0 and self.batchDirty:
+            self.writeSettingsFile()
+
    #############################################################################
    def writeSettingsFile(self, path=None):
       if not path:
+         if self.batchDepth > 0:
+            self.batchDirty = True
+            return
          path = self.settingsPath
-      f = open(path, 'w')
-      for key,val in self.settingsMap.iteritems():
+         self.batchDirty = False
+
+      # Write to a temp file and rename it over the original, so a crash or
+      # full disk mid-write can't leave a truncated settings file behind
+      tmpPath = path + '.tmp'
+      f = open(tmpPath, 'w')
+      try:
+         for key,val in self.settingsMap.iteritems():
+            try:
+               # Skip any entry whose value can't be converted
+               valStr = ''
+               if   isinstance(val, basestring):
+                  valStr = val
+               elif isinstance(val, int) or \
+                    isinstance(val, float) or \
+                    isinstance(val, long):
+                  valStr = str(val)
+               elif isinstance(val, list) or \
+                    isinstance(val, tuple):
+                  valStr = ' $  '.join([str(v) for v in val])
+               line = ''.join([toBytes(key).ljust(36), ' | ', \
+                                                      toBytes(valStr), '\n'])
+            except:
+               LOGEXCEPT('Invalid entry in SettingsFile... skipping')
+               continue
+            f.write(line)
+         f.close()
+      except:
+         # A failed write (e.g. disk full) must not replace the good file
          try:
-            # Skip anything that throws an exception
-            valStr = ''
-            if   isinstance(val, basestring):
-               valStr = val
-            elif isinstance(val, int) or \
-                 isinstance(val, float) or \
-                 isinstance(val, long):
-               valStr = str(val)
-            elif isinstance(val, list) or \
-                 isinstance(val, tuple):
-               valStr = ' $  '.join([str(v) for v in val])
-            f.write(key.ljust(36))
-            f.write(' | ')
-            f.write(toBytes(valStr))
-            f.write('\n')
-         except:
-            LOGEXCEPT('Invalid entry in SettingsFile... skipping')
-      f.close()
+            f.close()
+         finally:
+            os.remove(tmpPath)
+         raise
+
+      replaceFile(tmpPath, path)
 
 
    #############################################################################
@@ -3747,22 +3818,44 @@ def isInternetAvailable(forceOnline = False):
    else:
       try:
          import urllib2
-         urllib2.urlopen('http://google.com', timeout=CLI_OPTIONS.nettimeout)
-         internetStatus = INTERNET_STATUS.Available
       except ImportError:
          LOGERROR('No module urllib2 -- cannot determine if internet is '
             'available')
-      except urllib2.URLError:
-         # In the extremely rare case that google might be down (or just to try
-         # again...)
+         return internetStatus
+
+      # Probe all the hosts at once rather than one after the other, so an
+      # offline machine waits for one timeout instead of one per host.  In
+      # the extremely rare case that google might be down, the others
+      # still get us an answer.
+      probeResults = Queue.Queue()
+      def probeHost(url):
          try:
-            urllib2.urlopen('http://microsoft.com', timeout=CLI_OPTIONS.nettimeout)
-            internetStatus = INTERNET_STATUS.Available
+            urllib2.urlopen(url, timeout=CLI_OPTIONS.nettimeout)
+            probeResults.put(True)
          except:
-            LOGEXCEPT('Error checking for internet connection')
+            LOGEXCEPT('Error checking for internet connection (%s)', url)
+            probeResults.put(False)
+
+      for url in INTERNET_CHECK_URLS:
+         thr = threading.Thread(target=probeHost, args=(url,))
+         thr.daemon = True
+         thr.start()
+
+      # urlopen's timeout doesn't cover DNS resolution, so a stuck resolver
+      # could block a probe forever.  Bound the total wait here instead, and
+      # treat probes that haven't answered by then as failed.
+      deadline = RightNow() + CLI_OPTIONS.nettimeout + 1
+      for i in range(len(INTERNET_CHECK_URLS)):
+         try:
+            if probeResults.get(timeout=max(0, deadline - RightNow())):
+               internetStatus = INTERNET_STATUS.Available
+               break
+         except Queue.Empty:
+            LOGERROR('Internet check timed out')
             LOGERROR('Run --skip-online-check if you think this is an error')
-      except:
-         LOGEXCEPT('Error checking for internet connection')
+            break
+      else:
+         LOGERROR('Error checking for internet connection')
          LOGERROR('Run --skip-online-check if you think this is an error')
 
    return internetStatus
@@ -80,6 +80,10 @@ from bitcoinrpc_jsonrpc.authproxy import JSONRPCException
 #        (correctly) throw errors if you don't.  We can upgrade this in
 #        the future.
 class PyUnspentTxOut(object):
+   # One of these is built for every utxo of a wallet each time coins are
+   # selected, and the selection loops read these fields constantly
+   __slots__ = ('scrAddr', 'txHash', 'txOutIndex', 'val', 'conf', 'binScript')
+
    def __init__(self, scrAddr=None, txHash=None, txoIdx=None, val=None, 
                                              numConf=None, fullScript=None):
 
@@ -801,7 +801,7 @@ class PyBtcWalletRecovery(object):
                                                 extended, prevAddr.chaincode)
                   cid = cid +1
 
-               if extended.toHexStr() != newAddr.binPublicKey65.toHexStr():
+               if extended.toBinStr() != newAddr.binPublicKey65.toBinStr():
                   self.forkedPublicKeyChain.append([newAddr.chainIndex, \
                                                     byteLocation])
                   isPubForked = True
@@ -910,8 +910,8 @@ class PyBtcWalletRecovery(object):
                                                 prevAddr.chaincode)                  
                
                if keymismatch != 4:
-                  if prevkey.toHexStr() != \
-                     newAddr.binPrivKey32_Plain.toHexStr():
+                  if prevkey.toBinStr() != \
+                     newAddr.binPrivKey32_Plain.toBinStr():
                      """
                      Special case: The private key saved in the wallet doesn't 
                      match the extended private key.
@@ -961,7 +961,7 @@ class PyBtcWalletRecovery(object):
                                                       validPrivKey, \
                                                       validChainAddr.chaincode)
                         
-                     if prevkey.toHexStr() != validPrivKey.toHexStr():
+                     if prevkey.toBinStr() != validPrivKey.toBinStr():
                         isPrivForked = True
                         validAddr = newAddr.copy()
                         validAddr.binPrivKey32_Plain = validPrivKey.copy()
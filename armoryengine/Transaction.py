@@ -384,7 +384,7 @@ def getTxOutScriptDisplayStr(script):
       return scrAddr_to_addrStr(scrAddr)
    elif scrType==CPP_TXOUT_MULTISIG:
       M, N, addrs, pubs = getMultisigScriptInfo(script)
-      p2shStr = script_to_addrStr(script_to_p2sh_script(script))
+      p2shStr = binScript_to_p2shAddrStr(script)
       return '[Multisig %d-of-%d] (not P2SH but would be %s)' % (M,N,p2shStr)
    else:
       return '[Non-Standard Script: %s]: ' % binary_to_hex(scrAddr[1:65])
@@ -276,7 +276,7 @@ def getDisplayStringForScript(binScript, wltMap, lboxList, maxChars=256,
       M,N,a160s,pubs = getMultisigScriptInfo(binScript)
       lbID = calcLockboxID(binScript)
       dispStr = 'Unknown %d-of-%d (%s)' % (M,N,lbID)
-      addrStr = script_to_addrStr(script_to_p2sh_script(binScript))
+      addrStr = binScript_to_p2shAddrStr(binScript)
       if len(dispStr) + len(addrStr) + 3 <= maxChars:
          dispStr += ' [%s]' % addrStr
       elif len(dispStr) + lastTrunc + 6 <= maxChars:
@@ -284,7 +284,7 @@ def getDisplayStringForScript(binScript, wltMap, lboxList, maxChars=256,
    elif len(binScript) == 0:
       dispStr = 'Unknown Input' 
    else:
-      addrStr = script_to_addrStr(script_to_p2sh_script(binScript))
+      addrStr = binScript_to_p2shAddrStr(binScript)
       dispStr = 'Non-Standard: %s' % addrStr
       if len(dispStr) > maxChars:
          dispStr = dispStr[:maxChars-3] + '...'
@@ -53,6 +53,10 @@ class AllWalletsDispModel(QAbstractTableModel):
       return 5
 
    def data(self, index, role=Qt.DisplayRole):
+      if not role in (Qt.DisplayRole, Qt.TextAlignmentRole, \
+                      Qt.BackgroundColorRole, Qt.FontRole):
+         return QVariant()
+
       bdmState = TheBDM.getState()
       COL = WLTVIEWCOLS
       row,col = index.row(), index.column()
@@ -67,7 +71,7 @@ class AllWalletsDispModel(QAbstractTableModel):
          elif col==COL.Name: 
             return QVariant(wlt.labelName.ljust(32))
          elif col==COL.Secure: 
-            wtype,typestr = determineWalletType(wlt, self.main)
+            wtype,typestr = self.main.getWltType(wlt)
             return QVariant(typestr)
          elif col==COL.Bal:
             if not bdmState==BDM_BLOCKCHAIN_READY:
@@ -94,7 +98,7 @@ class AllWalletsDispModel(QAbstractTableModel):
             else:
                return QVariant(int(Qt.AlignLeft | Qt.AlignVCenter))
       elif role==Qt.BackgroundColorRole:
-         t = determineWalletType(wlt, self.main)[0]
+         t = self.main.getWltType(wlt)[0]
          if t==WLTTYPES.WatchOnly:
             return QVariant( Colors.TblWltOther )
          elif t==WLTTYPES.Offline:
@@ -109,6 +113,26 @@ class AllWalletsDispModel(QAbstractTableModel):
 
 
 
+   def refreshWallets(self, wltIDList):
+      """
+      Signal the view that only the rows for these wallets changed.  A full
+      reset() makes the view re-query every cell for every role, which is
+      wasteful for updates like side-scan progress that touch a single row
+      several times per second.
+
+      Both views of this model (the main wallet table and the address book)
+      show it unsorted, in walletIDList order, so there's no proxy to
+      re-sort.  Anything that puts a QSortFilterProxyModel in front of it
+      must setDynamicSortFilter(True), or the sort goes stale.
+      """
+      lastCol = self.columnCount()-1
+      for wltID in wltIDList:
+         row = self.main.walletIndices.get(wltID)
+         if row is None:
+            continue
+         self.emit(SIGNAL('dataChanged(QModelIndex,QModelIndex)'), \
+                   self.index(row, 0), self.index(row, lastCol))
+
    def headerData(self, section, orientation, role=Qt.DisplayRole):
       colLabels = ['', tr('ID'), tr('Wallet Name'), tr('Security'), tr('Balance')]
       if role==Qt.DisplayRole:
@@ -329,12 +353,6 @@ class LedgerDispModelSimple(QAbstractTableModel):
       rowData = self.ledger[row]
       nConf = rowData[LEDGERCOLS.NumConf]
       wltID = rowData[LEDGERCOLS.WltID]
-      wlt = self.main.walletMap.get(wltID)
-      
-      if wlt:
-         wtype = determineWalletType(self.main.walletMap[wltID], self.main)[0]
-      else:
-         wtype = WLTTYPES.WatchOnly
 
       #LEDGERCOLS  = enum( 'NumConf', 'UnixTime','DateStr', 'TxDir', 
                          # 'WltName', 'Comment', 'Amount', 'isOther', 
@@ -353,6 +371,14 @@ class LedgerDispModelSimple(QAbstractTableModel):
       elif role==Qt.DecorationRole:
          pass
       elif role==Qt.BackgroundColorRole:
+         # Only this role needs the wallet type, so don't look it up (and hit
+         # the wallet settings) for every other role of every cell
+         wlt = self.main.walletMap.get(wltID)
+         if wlt:
+            wtype = self.main.getWltType(wlt)[0]
+         else:
+            wtype = WLTTYPES.WatchOnly
+
          if wtype==WLTTYPES.WatchOnly:
             return QVariant( Colors.TblWltOther )
          elif wtype==WLTTYPES.Offline:
@@ -387,20 +413,21 @@ class LedgerDispModelSimple(QAbstractTableModel):
             if isConfirmed:
                return QVariant('Transaction confirmed!\n(%d confirmations)'%nConf)
             else:
-               tooltipStr = ''
+               # One format into a single literal, rather than formatting
+               # the count and then concatenating the explanation onto it
                if isCB:
-                  tooltipStr = '%d/120 confirmations'%nConf
-                  tooltipStr += ( '\n\nThis is a "generation" transaction from\n'
+                  tooltipStr = ( '%d/120 confirmations'
+                                 '\n\nThis is a "generation" transaction from\n'
                                  'Bitcoin mining.  These transactions take\n'
                                  '120 confirmations (approximately one day)\n'
-                                 'before they are available to be spent.')
+                                 'before they are available to be spent.') % nConf
                else:
-                  tooltipStr = '%d/6 confirmations'%rowData[COL.NumConf]
-                  tooltipStr += ( '\n\nFor small transactions, 2 or 3\n'
+                  tooltipStr = ( '%d/6 confirmations'
+                                 '\n\nFor small transactions, 2 or 3\n'
                                  'confirmations is usually acceptable.\n'
                                  'For larger transactions, you should\n'
                                  'wait for 6 confirmations before\n'
-                                 'trusting that the transaction is valid.')
+                                 'trusting that the transaction is valid.') % nConf
                return QVariant(tooltipStr)
          if col==COL.TxDir:
             #toSelf = self.index(index.row(), COL.toSelf).data().toBool()
@@ -960,9 +987,27 @@ class LedgerDispDelegate(QStyledItemDelegate):
 
    COL = LEDGERCOLS
 
+   # Confirmation icon for each conf count, the last entry covers everything
+   # past it.  Coinbase txs step through the same 6 icons over 120 confs.
+   CONF_ICONS    = tuple(':/conf%dt.png' % n for n in range(6)) + \
+                   (':/conf6t.png',)
+   CB_CONF_ICONS = tuple(':/conf%dt_nonum.png' % int(6*float(n)/120.)
+                                               for n in range(120)) + \
+                   (':/conf6t.png',)
+
+   # Shared by every ledger view, filled lazily since QPixmap needs the app
+   pixmapCache = {}
+
    def __init__(self, parent=None):
       super(LedgerDispDelegate, self).__init__(parent)   
 
+   def getPixmap(self, resPath):
+      pixmap = self.pixmapCache.get(resPath)
+      if pixmap is None:
+         pixmap = QPixmap.fromImage(QImage(resPath))
+         self.pixmapCache[resPath] = pixmap
+      return pixmap
+
 
    def paint(self, painter, option, index):
       bgcolor = QColor(index.model().data(index, Qt.BackgroundColorRole))
@@ -976,20 +1021,9 @@ class LedgerDispDelegate(QStyledItemDelegate):
       if index.column() == self.COL.NumConf:
          nConf = index.model().data(index).toInt()[0]
          isCoinbase = index.model().index(index.row(), self.COL.isCoinbase).data().toBool()
-         image=None
-         if isCoinbase:
-            if nConf<120:
-               effectiveNConf = int(6*float(nConf)/120.)
-               image = QImage(':/conf%dt_nonum.png'%effectiveNConf)
-            else:
-               image = QImage(':/conf6t.png')
-         else: 
-            if nConf<6:
-               image = QImage(':/conf%dt.png'%nConf)
-            else:
-               image = QImage(':/conf6t.png')
+         icons = self.CB_CONF_ICONS if isCoinbase else self.CONF_ICONS
+         pixmap = self.getPixmap(icons[max(0, min(nConf, len(icons)-1))])
          painter.fillRect(option.rect, bgcolor)
-         pixmap = QPixmap.fromImage(image)
          #pixmap.scaled(70, 30, Qt.KeepAspectRatio)
          painter.drawPixmap(option.rect, pixmap)
       elif index.column() == self.COL.TxDir:
@@ -997,22 +1031,20 @@ class LedgerDispDelegate(QStyledItemDelegate):
          # So I have to pass the amt as string, then convert here to long
          toSelf     = index.model().index(index.row(), self.COL.toSelf).data().toBool()
          isCoinbase = index.model().index(index.row(), self.COL.isCoinbase).data().toBool()
-         image = QImage()
 
          # isCoinbase still needs to be flagged in the C++ utils
          if isCoinbase:
-            image = QImage(':/moneyCoinbase.png')
+            pixmap = self.getPixmap(':/moneyCoinbase.png')
          elif toSelf:
-            image = QImage(':/moneySelf.png')
+            pixmap = self.getPixmap(':/moneySelf.png')
          else:
             txdir = str(index.model().data(index).toString()).strip()
             if txdir[0].startswith('-'):
-               image = QImage(':/moneyOut.png')
+               pixmap = self.getPixmap(':/moneyOut.png')
             else:
-               image = QImage(':/moneyIn.png')
+               pixmap = self.getPixmap(':/moneyIn.png')
 
          painter.fillRect(option.rect, bgcolor)
-         pixmap = QPixmap.fromImage(image)
          #pixmap.scaled(70, 30, Qt.KeepAspectRatio)
          painter.drawPixmap(option.rect, pixmap)
       else:
@@ -1065,6 +1097,12 @@ class WalletAddrDispModel(QAbstractTableModel):
          
       self.addr160List = [a.getAddr160() for a in addrList]
 
+      # getAddrStr() hashes and base58-encodes on every call, and data() needs
+      # it for nearly every cell, so keep the strings in a parallel list.
+      # Filled in by data() as rows are painted, so refiltering a large
+      # wallet doesn't encode every address up front.
+      self.addrB58List = [None]*len(self.addr160List)
+
 
    @TimeThisFunction
    def reset(self):
@@ -1080,13 +1118,21 @@ class WalletAddrDispModel(QAbstractTableModel):
       return 5
 
    def data(self, index, role=Qt.DisplayRole):
+      if not role in (Qt.DisplayRole, Qt.TextAlignmentRole, Qt.ForegroundRole, \
+                      Qt.FontRole, Qt.ToolTipRole, Qt.BackgroundColorRole, \
+                      Qt.UserRole):
+         return QVariant()
+
       COL = ADDRESSCOLS
       row,col = index.row(), index.column()
       if row>=len(self.addr160List):
          return QVariant('')
       addr = self.wlt.addrMap[self.addr160List[row]]
       addr160 = addr.getAddr160()
-      addrB58 = addr.getAddrStr()
+      addrB58 = self.addrB58List[row]
+      if addrB58 is None:
+         addrB58 = addr.getAddrStr()
+         self.addrB58List[row] = addrB58
       chainIdx = addr.chainIndex+1  # user must get 1-indexed
       if role==Qt.DisplayRole:
          if col==COL.Address: 
@@ -1111,6 +1157,21 @@ class WalletAddrDispModel(QAbstractTableModel):
                return QVariant('(...)')
             cppAddr = self.wlt.cppWallet.getScrAddrObjByKey(Hash160ToScrAddr(addr160))
             return QVariant( coin2str(cppAddr.getFullBalance(), maxZeros=2) )
+      elif role==Qt.UserRole:
+         # Native values for WalletAddrSortProxy, so sorting doesn't have to
+         # parse the display strings back into numbers
+         if col==COL.ChainIdx:
+            return QVariant( addr.chainIndex )
+         if col in (COL.NumTx, COL.Balance):
+            if not TheBDM.getState()==BDM_BLOCKCHAIN_READY:
+               return QVariant(0)
+            cppAddr = self.wlt.cppWallet.getScrAddrObjByKey(Hash160ToScrAddr(addr160))
+            if col==COL.NumTx:
+               return QVariant( cppAddr.getTxioCountFromSSH() )
+            # As a float:  a bare long above 2^31 may not survive the QVariant
+            # conversion, and satoshi totals are exact in a double
+            return QVariant( float(cppAddr.getFullBalance()) )
+         return self.data(index, Qt.DisplayRole)
       elif role==Qt.TextAlignmentRole:
          if col in (COL.Address, COL.Comment, COL.ChainIdx):
             return QVariant(int(Qt.AlignLeft | Qt.AlignVCenter))
@@ -1199,23 +1260,23 @@ class WalletAddrDispModel(QAbstractTableModel):
 class WalletAddrSortProxy(QSortFilterProxyModel):
    """      
    Acts as a proxy that re-maps indices to the table view so that data 
-   appears sorted, without actually touching the model
+   appears sorted, without actually touching the model.  WalletAddrDispModel
+   supplies native values under Qt.UserRole, so numeric columns compare as
+   numbers (imported addresses have chainIndex -2 and sort first).
    """      
+   def __init__(self, parent=None):
+      super(WalletAddrSortProxy, self).__init__(parent)
+      self.setSortRole(Qt.UserRole)
+
    def lessThan(self, idxLeft, idxRight):
       COL = ADDRESSCOLS
-      thisCol  = self.sortColumn()
-      strLeft  = str(self.sourceModel().data(idxLeft).toString())
-      strRight = str(self.sourceModel().data(idxRight).toString())
-      if thisCol==COL.Address:
-         return (strLeft.lower() < strRight.lower())
-      elif thisCol==COL.Comment:
+      thisCol = self.sortColumn()
+      if thisCol in (COL.Address, COL.Comment):
+         strLeft  = str(self.sourceModel().data(idxLeft).toString())
+         strRight = str(self.sourceModel().data(idxRight).toString())
+         if thisCol==COL.Address:
+            return (strLeft.lower() < strRight.lower())
          return (strLeft < strRight)
-      elif thisCol==COL.Balance:
-         return (float(strLeft.strip()) < float(strRight.strip()))
-      elif thisCol==COL.ChainIdx:
-         left = -2 if strLeft =='Imported' else int(strLeft)
-         rght = -2 if strRight=='Imported' else int(strRight)
-         return (left<rght)
       else:
          return super(WalletAddrSortProxy, self).lessThan(idxLeft, idxRight)
          
@@ -1315,7 +1376,7 @@ class TxInDispModel(QAbstractTableModel):
             return QVariant(int(Qt.AlignRight | Qt.AlignVCenter))
       elif role==Qt.BackgroundColorRole:
          if self.dispTable[row][COLS.WltID] and wltID in self.main.walletMap:
-            wtype = determineWalletType(self.main.walletMap[wltID], self.main)[0]
+            wtype = self.main.getWltType(self.main.walletMap[wltID])[0]
             if wtype==WLTTYPES.WatchOnly:
                return QVariant( Colors.TblWltOther )
             elif wtype==WLTTYPES.Offline:
@@ -1364,8 +1425,33 @@ class TxOutDispModel(QAbstractTableModel):
       self.txOutList = []
       self.wltIDList = []
       self.idxGray = idxGray[:]
+      self.dispTable = []
+
+      # Script parsing and wallet lookups don't change while the dialog is
+      # open, so do them once here instead of in data() for every cell on
+      # every paint.  Rows are laid out in TXOUTCOLS order.
       for i,txout in enumerate(self.tx.outputs):
          self.txOutList.append(txout)
+         dispInfo = self.main.getDisplayStringForScript(txout.binScript, 60)
+         wltID = ''
+         if dispInfo['WltID']:
+            wltID = dispInfo['WltID']
+         elif dispInfo['LboxID']:
+            wltID = dispInfo['LboxID']
+
+         stype = BtcUtils().getTxOutScriptTypeInt(txout.binScript)
+         stypeStr = CPP_TXOUT_SCRIPT_NAMES[stype]
+         if stype==CPP_TXOUT_MULTISIG:
+            M,N = getMultisigScriptInfo(txout.binScript)[:2]
+            stypeStr = 'MultiSig[%d-of-%d]' % (M,N)
+
+         self.dispTable.append([])
+         self.dispTable[-1].append(wltID)
+         self.dispTable[-1].append(dispInfo['String'])
+         self.dispTable[-1].append(coin2str(txout.getValue(),maxZeros=2))
+         self.dispTable[-1].append(stypeStr)
+         self.dispTable[-1].append(binary_to_hex(txout.binScript))
+         self.dispTable[-1].append(dispInfo['AddrStr'])
 
    def rowCount(self, index=QModelIndex()):
       return len(self.txOutList)
@@ -1375,30 +1461,16 @@ class TxOutDispModel(QAbstractTableModel):
 
    #TXOUTCOLS = enum('WltID', 'Recip', 'Btc', 'ScrType')
    def data(self, index, role=Qt.DisplayRole):
+      if not role in (Qt.DisplayRole, Qt.TextAlignmentRole, Qt.ForegroundRole, \
+                      Qt.BackgroundColorRole, Qt.FontRole):
+         return QVariant()
+
       COLS = TXOUTCOLS
       row,col = index.row(), index.column()
-      txout = self.txOutList[row]
-      dispInfo = self.main.getDisplayStringForScript(txout.binScript, 60)
-      wltID = ''
-      if dispInfo['WltID']:
-         wltID = dispInfo['WltID']
-      elif dispInfo['LboxID']:
-         wltID = dispInfo['LboxID']
-      
-
-      stype = BtcUtils().getTxOutScriptTypeInt(txout.binScript)
-      stypeStr = CPP_TXOUT_SCRIPT_NAMES[stype]
-      if stype==CPP_TXOUT_MULTISIG:
-         M,N = getMultisigScriptInfo(txout.binScript)[:2]
-         stypeStr = 'MultiSig[%d-of-%d]' % (M,N)
+      wltID = self.dispTable[row][COLS.WltID]
 
       if role==Qt.DisplayRole:
-         if col==COLS.WltID:   return QVariant(wltID)
-         if col==COLS.ScrType: return QVariant(stypeStr)
-         if col==COLS.Script:  return QVariant(binary_to_hex(txout.binScript))
-         if col==COLS.Btc:     return QVariant(coin2str(txout.getValue(),maxZeros=2))
-         if col==COLS.Recip:   return QVariant(dispInfo['String'])
-         if col==COLS.AddrStr: return QVariant(dispInfo['AddrStr'])
+         return QVariant(self.dispTable[row][col])
       elif role==Qt.TextAlignmentRole:
          if col==COLS.Recip:   return QVariant(int(Qt.AlignLeft | Qt.AlignVCenter))
          if col==COLS.Btc:     return QVariant(int(Qt.AlignRight | Qt.AlignVCenter))
@@ -1408,7 +1480,7 @@ class TxOutDispModel(QAbstractTableModel):
             return QVariant(Colors.Mid)
       elif role==Qt.BackgroundColorRole:
          if wltID and wltID in self.main.walletMap:
-            wtype = determineWalletType(self.main.walletMap[wltID], self.main)[0]
+            wtype = self.main.getWltType(self.main.walletMap[wltID])[0]
             if wtype==WLTTYPES.WatchOnly:
                return QVariant( Colors.TblWltOther )
             if wtype==WLTTYPES.Offline:
@@ -1457,11 +1529,18 @@ class SentToAddrBookModel(QAbstractTableModel):
       # Must use awkwardness to get around iterating a vector<RegisteredTx> in
       # the python code... :(
       addressBook = self.wlt.cppWallet.createAddressBook();
+
+      # Everything displayed is fixed for the life of the model, so build the
+      # display values here, as each entry is added, instead of in data()
+      #ADDRBOOKCOLS = enum('Address', 'WltID', 'NumSent', 'Comment')
+      self.dispTable = []
       for abe in addressBook:     
 
          scrAddr = abe.getScrAddr()
          try:
-            addr160 = addrStr_to_hash160(scrAddr_to_addrStr(scrAddr))[1]
+            # Raises for anything but P2PKH/P2SH, so scrAddr[1:] is the hash
+            addrB58 = scrAddr_to_addrStr(scrAddr)
+            addr160 = scrAddr[1:]
             
             # Only grab addresses that are not in any of your Armory wallets
             if not self.main.getWalletForAddr160(addr160):
@@ -1470,13 +1549,16 @@ class SentToAddrBookModel(QAbstractTableModel):
                txhashlist = []
                for i in range(ntx):
                   txhashlist.append( abeList[i].getTxHash() )
+               comment = self.wlt.getCommentForTxList(addr160, txhashlist)
+
+               # Owned addresses were just filtered out, so no ownership ID
                self.addrBook.append( [scrAddr, txhashlist] )
+               self.dispTable.append( [addrB58, '', ntx, comment] )
          except Exception as e:
             # This is not necessarily an error. It could be a lock box LOGERROR(str(e))
             pass
 
 
-
    def rowCount(self, index=QModelIndex()):
       return len(self.addrBook)
 
@@ -1484,30 +1566,15 @@ class SentToAddrBookModel(QAbstractTableModel):
       return 4
 
    def data(self, index, role=Qt.DisplayRole):
+      if not role in (Qt.DisplayRole, Qt.TextAlignmentRole, Qt.FontRole):
+         return QVariant()
+
       COL = ADDRBOOKCOLS
       row,col  = index.row(), index.column()
-      scrAddr  = self.addrBook[row][0]
-      if scrAddr[0] in [SCRADDR_P2PKH_BYTE, SCRADDR_P2SH_BYTE]:
-         addrB58 = scrAddr_to_addrStr(scrAddr)
-         addr160 = scrAddr[1:]
-      else:
-         addrB58 = ''
-         addr160 = ''
-      wltID    = self.main.getWalletForAddr160(addr160)
-      txList   = self.addrBook[row][1]
-      numSent  = len(txList)
-      comment  = self.wlt.getCommentForTxList(addr160, txList)
-      
-      #ADDRBOOKCOLS = enum('Address', 'WltID', 'NumSent', 'Comment')
+      numSent  = self.dispTable[row][COL.NumSent]
+
       if role==Qt.DisplayRole:
-         if col==COL.Address: 
-            return QVariant( addrB58 )
-         if col==COL.NumSent: 
-            return QVariant( numSent ) 
-         if col==COL.Comment: 
-            return QVariant( comment )
-         if col==COL.WltID:
-            return QVariant( wltID )
+         return QVariant( self.dispTable[row][col] )
       elif role==Qt.TextAlignmentRole:
          if col in (COL.Address, COL.Comment, COL.WltID):
             return QVariant(int(Qt.AlignLeft | Qt.AlignVCenter))
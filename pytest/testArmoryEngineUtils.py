@@ -82,6 +82,8 @@ class ArmoryEngineTest(unittest.TestCase):
       self.callTestFunction('hex_to_int',    i,    hstr, BIGENDIAN)
       self.callTestFunction('int_to_binary', bstr, i   , 2, BIGENDIAN)
       self.callTestFunction('binary_to_int', i,    bstr, BIGENDIAN)
+      self.callTestFunction('hex_to_binary', bstr, 'fd0f', LITTLEENDIAN, BIGENDIAN)
+      self.callTestFunction('binary_to_hex', 'fd0f', bstr, BIGENDIAN, LITTLEENDIAN)
 
       #h   = '00000123456789abcdef000000'
       #ans = 'aaaaabcdeghjknrsuwxyaaaaaa'
@@ -172,6 +174,35 @@ class ArmoryEngineTest(unittest.TestCase):
       self.callTestFunction('hash160', hex_to_binary('d418dd224e11e1d3b37b5f46b072ccf4e4e26203'), bstr)
       self.callTestFunction('binaryBits_to_difficulty', blockhashBEDifficulty, blockhashBE)
 
+   #############################################################################
+   def testBase58(self):
+      vectors = [ ['',                   ''    ], \
+                  ['\x00',               '1'   ], \
+                  ['\x00\x00\xff',       '115Q'], \
+                  ['a',                  '2g'  ], \
+                  ['\x39',               'z'   ], \
+                  ['\x3a',               '21'  ], \
+                  ['bbb',                'a3gV'] ]
+      for binStr,b58Str in vectors:
+         self.callTestFunction('binary_to_base58', b58Str, binStr)
+         self.callTestFunction('base58_to_binary', binStr, b58Str)
+
+      addr25 = hex_to_binary('00eb15231dfceb60925886b67d065299925915aeb172c06647')
+      self.callTestFunction('binary_to_base58', \
+                            '1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L', addr25)
+      self.callTestFunction('base58_to_binary', \
+                            addr25, '1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L')
+
+      self.assertRaises(NonBase58CharacterError, base58_to_binary, '1NS0')
+
+   #############################################################################
+   def testIsLikelyDataType(self):
+      self.assertEqual(isLikelyDataType('00ff3aBC'), DATATYPE.Hex)
+      self.assertEqual(isLikelyDataType('1NS17iag9jJgTHD1'), DATATYPE.Base58)
+      self.assertEqual(isLikelyDataType('1NS0'), DATATYPE.Binary)
+      self.assertEqual(isLikelyDataType('\x00\xff'), DATATYPE.Binary)
+      self.assertTrue(isLikelyDataType('abc', DATATYPE.Hex))
+
    #############################################################################
    def callTestFunction(self, fnName, expectedOutput, *args, **kwargs):
       """
@@ -382,6 +413,7 @@ class ArmoryEngineTest(unittest.TestCase):
       self.assertEqual(prefix, P2SHBYTE)
       self.assertEqual(a160, hashVal)
       self.assertTrue(addrStr_is_p2sh(addrStr05))
+      self.assertFalse(addrStr_is_p2sh(addrStr05[:-1] + '0'))
 
       self.assertRaises(BadAddressError, addrStr_to_hash160, addrStrA3)
       self.assertRaises(ChecksumError, addrStr_to_hash160, addrStrBad)
@@ -464,6 +496,7 @@ class ArmoryEngineTest(unittest.TestCase):
       self.assertEqual(scraddr, script_to_scrAddr(script))  # this uses C++
       # Go round trip to avoid dependency on the network. Works in both main-net or testnet
       self.assertEqual(scraddr, addrStr_to_scrAddr(scrAddr_to_addrStr(scraddr)))
+      self.assertEqual((ADDRBYTE, a160), scrAddr_to_hash160(scraddr))
       
 
       ##### Pay to PubKey65
@@ -495,6 +528,7 @@ class ArmoryEngineTest(unittest.TestCase):
       scraddr = hex_to_binary("ff") + hash160(hex_to_binary("76a90088ac"))
 
       self.assertEqual(scraddr, script_to_scrAddr(script))
+      self.assertRaises(BadAddressError, scrAddr_to_hash160, scraddr)
 
       
       ##### P2SH
@@ -505,6 +539,7 @@ class ArmoryEngineTest(unittest.TestCase):
       self.assertEqual(script,  scrAddr_to_script(scraddr))
       self.assertEqual(scraddr, script_to_scrAddr(script))  # this uses C++
       self.assertEqual(scraddr, addrStr_to_scrAddr(scrAddr_to_addrStr(scraddr)))
+      self.assertEqual((P2SHBYTE, a160), scrAddr_to_hash160(scraddr))
 
 
 ################################################################################
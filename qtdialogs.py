@@ -2529,8 +2529,7 @@ def showRecvCoinsWarningIfNecessary(wlt, parent, main):
    wlttype = determineWalletType(wlt, main)[0]
    notMyWallet = (wlttype == WLTTYPES.WatchOnly)
    offlineWallet = (wlttype == WLTTYPES.Offline)
-   dnaaPropName = 'Wallet_%s_%s' % (wlt.uniqueIDB58, 'DNAA_RecvOther')
-   dnaaThisWallet = main.getSettingOrSetDefault(dnaaPropName, False)
+   dnaaThisWallet = main.getWltSetting(wlt.uniqueIDB58, 'DNAA_RecvOther', False)
    if notMyWallet and not dnaaThisWallet:
       result = MsgBoxWithDNAA(parent, main, MSGBOX.Warning, 'This is not your wallet!', \
             'You are getting an address for a wallet that '
@@ -2541,7 +2540,7 @@ def showRecvCoinsWarningIfNecessary(wlt, parent, main):
             'wallet on a separate computer), then please change the '
             '"Belongs To" field in the wallet-properties for this wallet.', \
             'Do not show this warning again', wCancel=True)
-      main.writeSetting(dnaaPropName, result[1])
+      main.setWltSetting(wlt.uniqueIDB58, 'DNAA_RecvOther', result[1])
       return result[0]
 
    if offlineWallet and not dnaaThisWallet:
@@ -2555,7 +2554,7 @@ def showRecvCoinsWarningIfNecessary(wlt, parent, main):
             'address.  Instead, change the wallet properties "Belongs To" field '
             'to specify that this wallet is not actually yours.', \
             'Do not show this warning again', wCancel=True)
-      main.writeSetting(dnaaPropName, result[1])
+      main.setWltSetting(wlt.uniqueIDB58, 'DNAA_RecvOther', result[1])
       return result[0]
    return True
 
@@ -8126,9 +8125,14 @@ class DlgAddressBook(ArmoryDialog):
       self.wltDispView.setMaximumHeight(rowHeight * 7.7)
       self.wltDispView.hideColumn(WLTVIEWCOLS.Visible)
       initialColResize(self.wltDispView, [0.15, 0.30, 0.2, 0.20])
-      self.connect(self.wltDispView.selectionModel(), \
-                   SIGNAL('currentChanged(const QModelIndex &, const QModelIndex &)'), \
-                   self.wltTableClicked)
+      self.wltDispView.selectionModel().currentChanged.connect(self.wltTableClicked)
+
+      # Rebuilding the address tables is expensive, so collapse a burst of
+      # wallet-selection changes into a single rebuild
+      self.wltSelTimer = QTimer(self)
+      self.wltSelTimer.setSingleShot(True)
+      self.wltSelTimer.setInterval(0)
+      self.connect(self.wltSelTimer, SIGNAL('timeout()'), self.rebuildAddrBookModels)
 
 
 
@@ -8181,9 +8185,7 @@ class DlgAddressBook(ArmoryDialog):
          self.connect( self.lboxView, 
             SIGNAL('doubleClicked(QModelIndex)'), 
             self.dblClickedLockbox)
-         self.connect(self.lboxView.selectionModel(), \
-             SIGNAL('currentChanged(const QModelIndex &, const QModelIndex &)'), \
-             self.clickedLockbox)
+         self.lboxView.selectionModel().currentChanged.connect(self.clickedLockbox)
       else:
          self.lboxView = None
       self.connect(self.tabWidget, SIGNAL('currentChanged(int)'), self.tabChanged)   
@@ -8318,9 +8320,8 @@ class DlgAddressBook(ArmoryDialog):
       freqSize = 1.3 * tightSizeStr(self.addrBookTxView, 'Times Used')[0]
       initialColResize(self.addrBookTxView, [0.3, 0.1, freqSize, 0.5])
       self.addrBookTxView.hideColumn(ADDRBOOKCOLS.WltID)
-      self.connect(self.addrBookTxView.selectionModel(), \
-                   SIGNAL('currentChanged(const QModelIndex &, const QModelIndex &)'), \
-                   self.addrTableTxClicked)
+      self.addrBookTxView.selectionModel().currentChanged.connect( \
+                                                      self.addrTableTxClicked)
 
    #############################################################################
    def disableSelectButtons(self):
@@ -8379,9 +8380,8 @@ class DlgAddressBook(ArmoryDialog):
       self.addrBookRxView.verticalHeader().setDefaultSectionSize(20)
       iWidth = tightSizeStr(self.addrBookRxView, 'Imp')[0]
       initialColResize(self.addrBookRxView, [iWidth * 1.3, 0.3, 0.35, 64, 0.3])
-      self.connect(self.addrBookRxView.selectionModel(), \
-                   SIGNAL('currentChanged(const QModelIndex &, const QModelIndex &)'), \
-                   self.addrTableRxClicked)
+      self.addrBookRxView.selectionModel().currentChanged.connect( \
+                                                      self.addrTableRxClicked)
 
 
    #############################################################################
@@ -8393,8 +8393,12 @@ class DlgAddressBook(ArmoryDialog):
       row = currIndex.row()
       self.selectedWltID = str(currIndex.model().index(row, WLTVIEWCOLS.ID).data().toString())
 
-      self.setAddrBookTxModel(self.selectedWltID)
-      self.setAddrBookRxModel(self.selectedWltID)
+      # Build the first set of models right away so the saved column widths
+      # restored in __init__ have something to apply to
+      if self.addrBookRxModel is None:
+         self.rebuildAddrBookModels()
+      else:
+         self.wltSelTimer.start()
 
 
       if not self.isBrowsingOnly:
@@ -8410,6 +8414,20 @@ class DlgAddressBook(ArmoryDialog):
             self.disableSelectButtons()
             self.selectedAddr = ''
             self.selectedCmmt = ''
+
+
+   #############################################################################
+   def rebuildAddrBookModels(self):
+      # A burst of selection changes can land back on the wallet already
+      # shown, in which case the existing models are still valid
+      if self.addrBookTxModel is not None and \
+         self.addrBookTxModel.wltID == self.selectedWltID:
+         self.addrBookTxView.clearSelection()
+         self.addrBookRxView.clearSelection()
+         return
+
+      self.setAddrBookTxModel(self.selectedWltID)
+      self.setAddrBookRxModel(self.selectedWltID)
       self.addrBookTxModel.reset()
 
 
@@ -12703,10 +12721,11 @@ class DlgRestoreWOData(ArmoryDialog):
       if not os.path.exists(fn):
          return
 
-      # Read in the data.
-      # Protip: readlines() leaves in '\n'. read().splitlines() nukes '\n'.
-      loadFile = open(fn, 'rb')
-      fileLines = loadFile.read().splitlines()
+      # Read in the data.  Only the first six lines are used, so read just
+      # those rather than slurping whatever file the user happened to pick.
+      # Universal newlines, so files saved with bare '\r' endings still load.
+      loadFile = open(fn, 'rU')
+      fileLines = [loadFile.readline().rstrip('\n') for i in range(6)]
       loadFile.close()
 
       # Confirm that we have an actual PKCC file.
@@ -667,6 +667,9 @@ class DlgLockboxManager(ArmoryDialog):
       
       self.lboxProxy = LockboxDisplayProxy(self)
       self.lboxProxy.setSourceModel(self.lboxModel)
+      # Rows are refreshed with dataChanged rather than reset(), so let the
+      # proxy re-sort when a box's #Tx or balance changes
+      self.lboxProxy.setDynamicSortFilter(True)
       self.lboxProxy.sort(LOCKBOXCOLS.CreateDate, Qt.DescendingOrder)
       self.lboxView = QTableView()
       self.lboxView.setModel(self.lboxProxy)
@@ -1427,7 +1430,7 @@ class DlgLockboxManager(ArmoryDialog):
    
          lboxId = getModelStr(LOCKBOXCOLS.ID)
          lbox = self.main.getLockboxByID(lboxId)
-         p2shAddr = script_to_addrStr(script_to_p2sh_script(lbox.binScript)) if lbox else None
+         p2shAddr = binScript_to_p2shAddrStr(lbox.binScript) if lbox else None
    
          if action == actionCopyAddr:
             clippy = p2shAddr
@@ -3669,12 +3672,9 @@ class DlgMergePromNotes(ArmoryDialog):
   
       defaultTarg = None
       if self.promMustMatch:
-         for lbox in self.main.allLockboxes:
-            if lbox.p2shScrAddr == self.promMustMatch:
-               defaultTarg = lbox.uniqueIDB58
-               break
-         else:
-            defaultTarg = scrAddr_to_addrStr(self.promMustMatch)
+         targAddrStr = scrAddr_to_addrStr(self.promMustMatch)
+         lbox = self.main.getLockboxByP2SHAddrStr(targAddrStr)
+         defaultTarg = targAddrStr if lbox is None else lbox.uniqueIDB58
                
          
       dlg = DlgCreatePromNote(self, self.main, defaultTarg, skipExport=True)
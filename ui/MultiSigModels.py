@@ -26,6 +26,8 @@ class LockboxDisplayModel(QAbstractTableModel):
       self.boxList = allLockboxes
       self.dateFmt = dateFormat
       self.main = main
+      self.keyDispCache = {}
+      self.dateDispCache = {}
 
 
 
@@ -42,9 +44,29 @@ class LockboxDisplayModel(QAbstractTableModel):
       if len(lbox.commentList[i].strip())>0:
          return lbox.commentList[i]
       else:
-         pubhex = binary_to_hex(lbox.pkList[i])
-         addr = hash160_to_addrStr(lbox.a160List[i])
-         return "%s (%s...)" % (addr, pubhex[:20])
+         # The lockbox ID is derived from its script, so the keys behind an
+         # ID never change and the hashed/encoded string only needs building
+         # once.  Comments can be edited, so those are still checked above.
+         cacheKey = (lbox.uniqueIDB58, i)
+         keyDisp = self.keyDispCache.get(cacheKey)
+         if keyDisp is None:
+            pubhex = binary_to_hex(lbox.pkList[i])
+            addr = hash160_to_addrStr(lbox.a160List[i])
+            keyDisp = "%s (%s...)" % (addr, pubhex[:20])
+            self.keyDispCache[cacheKey] = keyDisp
+         return keyDisp
+
+   def getDateDisp(self, lbox):
+      # Formatting goes through datetime, strftime and two codecs, and the
+      # result only depends on the creation time (the format is fixed for
+      # the life of the model), so do it once per lockbox.  An edited box
+      # keeps its ID, hence the createDate in the key.
+      cacheKey = (lbox.uniqueIDB58, lbox.createDate)
+      dateDisp = self.dateDispCache.get(cacheKey)
+      if dateDisp is None:
+         dateDisp = unixTimeToFormatStr(lbox.createDate, self.dateFmt)
+         self.dateDispCache[cacheKey] = dateDisp
+      return dateDisp
 
    def data(self, index, role=Qt.DisplayRole):
       row,col = index.row(), index.column()
@@ -52,16 +74,22 @@ class LockboxDisplayModel(QAbstractTableModel):
       lbID = lbox.uniqueIDB58
       lwlt = self.main.cppLockboxWltMap[lbID]
 
+      # Only ask the C++ wallet for the values this role/column actually uses.
+      # They can't be cached here:  the model isn't reset when a new block
+      # changes a balance, the view just repaints.
       nTx, bal = 0, 0
       if TheBDM.getState()==BDM_BLOCKCHAIN_READY:
-         nTx = lwlt.getWltTotalTxnCount()
-         bal = lwlt.getFullBalance()
+         isDisp = (role==Qt.DisplayRole)
+         if role==Qt.FontRole or (isDisp and col==LOCKBOXCOLS.NumTx):
+            nTx = lwlt.getWltTotalTxnCount()
+         if role==Qt.BackgroundColorRole or (isDisp and col==LOCKBOXCOLS.Balance):
+            bal = lwlt.getFullBalance()
 
       if role==Qt.DisplayRole:
          if col==LOCKBOXCOLS.ID: 
             return QVariant(lbID)
          elif col==LOCKBOXCOLS.CreateDate: 
-            return QVariant(unixTimeToFormatStr(lbox.createDate, self.dateFmt))
+            return QVariant(self.getDateDisp(lbox))
          elif col==LOCKBOXCOLS.MSType: 
             return QVariant('%d-of-%d' % (lbox.M, lbox.N))
          elif col==LOCKBOXCOLS.LBName: 
@@ -116,6 +144,18 @@ class LockboxDisplayModel(QAbstractTableModel):
       return QVariant()
 
 
+   def refreshLockboxes(self, lbIDList):
+      # Scan progress and enable/disable notifications only touch the rows
+      # of the boxes named in them, so don't make the view re-query the
+      # whole table (and the C++ wallets behind it) with a reset()
+      lastCol = self.columnCount()-1
+      for lbID in lbIDList:
+         row = self.main.lockboxIDMap.get(lbID)
+         if row is None:
+            continue
+         self.emit(SIGNAL('dataChanged(QModelIndex,QModelIndex)'), \
+                   self.index(row, 0), self.index(row, lastCol))
+
    def headerData(self, section, orientation, role=Qt.DisplayRole):
       colLabels = ['ID', 'Type', 'Created', 'Info', 
                    'Key #1', 'Key #2', 'Key #3', 'Key #4', 'Key #5', 
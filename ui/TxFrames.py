@@ -472,12 +472,14 @@ class SendBitcoinsFrame(ArmoryFrame):
 
          return False
 
-      # Construct recipValuePairs and check that all metrics check out
+      # Construct recipValuePairs and check that all metrics check out.  The
+      # address strings and scripts were already read and parsed above, so
+      # reuse them instead of going back to the line edits.
       scriptValPairs = []
       totalSend = 0
       for row in range(len(self.widgetTable)):
          try:
-            recipStr = str(self.widgetTable[row]['QLE_ADDR'].text()).strip()
+            recipStr = addrList[row]
             valueStr = str(self.widgetTable[row]['QLE_AMT'].text()).strip()
             value = str2coin(valueStr, negAllowed=False)
             if value == 0:
@@ -510,7 +512,7 @@ class SendBitcoinsFrame(ArmoryFrame):
 
          totalSend += value
 
-         script = self.widgetTable[row]['FUNC_GETSCRIPT']()['Script']
+         script = scripts[row]
          #scraddr = script_to_scrAddr(script)
 
          # Checking for sending bitcoins to a Lockbox using P2SH that is